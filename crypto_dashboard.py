@@ -8,24 +8,69 @@ Usage:
 """
 
 import argparse
+import asyncio
+import atexit
 import logging
-import os
+import logging.handlers
+import math
+import queue
+import random
 import sys
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import warnings
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple, Union
 
-import requests
+import aiohttp
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+try:
+    from rich.live import Live
+    from rich.table import Table
+    HAS_RICH = True
+except ImportError:
+    HAS_RICH = False
+
+# aiohttp decodes Brotli responses only when one of these is installed,
+# so "br" is advertised to the server only in that case.
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
 
 
 # Configuration
 @dataclass
 class Config:
     """Application configuration."""
-    coins: List[str]
+    coins: List[str] = field(default_factory=list)
     update_interval: int = 10
     api_base_url: str = "https://api.coingecko.com/api/v3"
     request_timeout: int = 10
+    cache_ttl: float = 30
+    history_size: int = 720
+    display_names: List[str] = field(init=False, default_factory=list)
+    
+    def __post_init__(self):
+        """Normalize coin IDs and precompute their display names once."""
+        self.coins = [c.strip().lower() for c in self.coins]
+        self.display_names = [c.title() for c in self.coins]
 
 
 # ANSI Color codes
@@ -37,6 +82,12 @@ class Colors:
     BOLD = "\033[1m"
 
 
+@dataclass
+class RateLimited:
+    """Returned by fetch_prices when the API asks us to back off."""
+    retry_after: float
+
+
 class CoinGeckoAPI:
     """
     Client for interacting with the CoinGecko API.
@@ -45,29 +96,117 @@ class CoinGeckoAPI:
     error handling and rate limiting.
     """
     
-    def __init__(self, base_url: str, timeout: int = 10):
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Upper bound on how long a Retry-After header can pause the dashboard
+    MAX_RETRY_AFTER = 3600
+    # Tolerance for timer jitter when a poll lands exactly one TTL later
+    CACHE_SLACK = 0.1
+    
+    def __init__(self, base_url: str, timeout: int = 10, cache_ttl: float = 30,
+                 max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_cap: float = 10):
         """
         Initialize the API client.
         
         Args:
             base_url: Base URL for the CoinGecko API
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to reuse a previous response for the same coins
+            max_retries: Retries on 429/5xx responses before giving up
+            backoff_base: Minimum delay between retries in seconds
+            backoff_cap: Maximum delay between retries in seconds
         """
         self.base_url = base_url
         self.timeout = timeout
-        self.session = requests.Session()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._cache: Dict[Tuple[str, ...], Tuple[float, Dict]] = {}
+        self._cache_ttl = cache_ttl
+        # Wall-clock time of the last response that came from the network
+        self.last_fetch_time: Optional[float] = None
+        # Last (ETag, body) seen per coin set, for conditional requests
+        self._etags: Dict[Tuple[str, ...], Tuple[str, Dict]] = {}
+        # A single pooled connector keeps the TLS socket to the API warm
+        # across polling iterations instead of re-handshaking each time.
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            ),
+            headers={
+                "Connection": "keep-alive",
+                "Accept": "application/json",
+                "Accept-Encoding": "br, gzip, deflate" if HAS_BROTLI else "gzip, deflate",
+                "User-Agent": "crypto_dashboard/1.0"
+            }
+        )
         self.logger = logging.getLogger(__name__)
     
-    def fetch_prices(self, coin_ids: List[str]) -> Optional[Dict]:
+    @classmethod
+    def _parse_retry_after(cls, value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header given either in seconds or as an HTTP date.
+        
+        Args:
+            value: Raw header value, if present
+            
+        Returns:
+            Seconds to wait, clamped to [0, MAX_RETRY_AFTER], or None if the
+            header is missing, malformed or not a finite number
+        """
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        if not math.isfinite(seconds):
+            return None
+        return min(max(0.0, seconds), cls.MAX_RETRY_AFTER)
+    
+    def _next_delay(self, prev_delay: float, retry_after: Optional[float] = None) -> float:
+        """
+        Pick the next retry delay using decorrelated jitter.
+        
+        Args:
+            prev_delay: Delay used before the previous retry
+            retry_after: Server-requested wait from Retry-After, if any
+            
+        Returns:
+            Seconds to wait, between backoff_base and backoff_cap
+        """
+        delay = min(self.backoff_cap, random.uniform(self.backoff_base, prev_delay * 3))
+        if retry_after is not None:
+            delay = min(self.backoff_cap, max(delay, retry_after))
+        return delay
+    
+    async def fetch_prices(self, coin_ids: List[str]) -> Optional[Union[Dict, RateLimited]]:
         """
         Fetch current prices and 24h changes for specified coins.
         
+        429 and 5xx responses are retried with exponential backoff and
+        decorrelated jitter, capped at backoff_cap seconds.
+        
         Args:
             coin_ids: List of CoinGecko coin identifiers
             
         Returns:
-            Dictionary containing price data, or None if request fails
+            Dictionary containing price data, RateLimited if the API asked
+            for a longer pause than backoff_cap, or None if request fails
         """
+        key = tuple(sorted(coin_ids))
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl - self.CACHE_SLACK:
+            self.logger.debug("Serving prices from cache")
+            return cached[1]
+        
         url = f"{self.base_url}/simple/price"
         params = {
             "ids": ",".join(coin_ids),
@@ -75,24 +214,77 @@ class CoinGeckoAPI:
             "include_24hr_change": "true"
         }
         
+        # Endpoints that emit ETags (mirrors, caching proxies) can answer
+        # with an empty 304 when nothing changed since the last response.
+        etag_entry = self._etags.get(key)
+        headers = {"If-None-Match": etag_entry[0]} if etag_entry else None
+        
+        # Entries are stamped when the request starts, so with a TTL that is
+        # a multiple of the polling interval the tick one TTL later refetches
+        started = time.monotonic()
+        delay = self.backoff_base
+        retry_in: Optional[float] = None
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.Timeout:
+            for attempt in range(self.max_retries + 1):
+                if retry_in is not None:
+                    # Sleep here, after the previous response was released
+                    # back to the pool, rather than while holding it.
+                    await asyncio.sleep(retry_in)
+                
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    if response.status in self.RETRY_STATUSES:
+                        retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                        out_of_retries = attempt == self.max_retries
+                        
+                        if response.status == 429 and retry_after is not None and (
+                                retry_after > self.backoff_cap or out_of_retries):
+                            self.logger.warning(f"Rate limited, server asked to wait {retry_after:.0f}s")
+                            return RateLimited(retry_after)
+                        
+                        if not out_of_retries:
+                            delay = self._next_delay(delay, retry_after)
+                            self.logger.warning(
+                                f"HTTP {response.status}, retrying in {delay:.1f}s "
+                                f"(attempt {attempt + 1}/{self.max_retries})"
+                            )
+                            # Drain the error body so the connection is reusable
+                            await response.read()
+                            retry_in = delay
+                            continue
+                    
+                    if response.status == 304 and etag_entry:
+                        self.logger.debug("Prices not modified since last response")
+                        data = etag_entry[1]
+                    else:
+                        response.raise_for_status()
+                        self.logger.debug(
+                            f"Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}"
+                        )
+                        data = orjson.loads(await response.read())
+                        etag = response.headers.get("ETag")
+                        if etag:
+                            self._etags[key] = (etag, data)
+                        else:
+                            self._etags.pop(key, None)
+                self._cache[key] = (started, data)
+                self.last_fetch_time = time.time()
+                return data
+        except asyncio.TimeoutError:
             self.logger.error("Request timed out")
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectionError:
             self.logger.error("Connection error - check your internet connection")
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error: {e.response.status_code}")
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientResponseError as e:
+            self.logger.error(f"HTTP error: {e.status}")
+        except aiohttp.ClientError as e:
             self.logger.error(f"Request failed: {e}")
+        except ValueError:
+            self.logger.error("Received invalid JSON from API")
         
         return None
     
-    def close(self):
+    async def close(self):
         """Close the session."""
-        self.session.close()
+        await self.session.close()
 
 
 class CryptoDashboard:
@@ -113,99 +305,317 @@ class CryptoDashboard:
         self.config = config
         self.api = api_client
         self.logger = logging.getLogger(__name__)
+        self._prev_rows: Dict[str, str] = {}
+        # The change cell is padded before coloring, since escape codes
+        # would otherwise count toward its width
+        self._row_fmt = "{name:<15} {price:>15} {change} {range:>10}".format
+        # Static frame pieces for the ANSI renderer, built once
+        self._divider = f"{Colors.BOLD}{'=' * 60}{Colors.RESET}"
+        self._header = (
+            f"{Colors.BOLD}{'Coin':<15} {'Price (USD)':>15} {'24h Change':>15} {'Range':>10}{Colors.RESET}"
+        )
+        self._footer_fmt = "\033[KLast updated: {}\n\033[KPress Ctrl+C to exit\n".format
+        # Ring buffer of recent USD prices, one row per coin (needs numpy)
+        self._history = (
+            np.full((len(config.coins), config.history_size), np.nan, dtype=np.float32)
+            if HAS_NUMPY else None
+        )
+        self._hist_idx = 0
+        self._last_fetch_time: Optional[float] = None
+        # Prefer rich's double-buffered renderer; fall back to raw ANSI output
+        self._live = Live(self._build_table({}), refresh_per_second=4, screen=False) if HAS_RICH else None
     
     @staticmethod
-    def clear_screen():
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
-    
-    def format_price_change(self, change: float) -> str:
+    def _change_text(change: float) -> str:
         """
-        Format price change with color and arrow indicator.
+        Format price change with an arrow indicator but no color.
         
         Args:
             change: 24-hour price change percentage
             
         Returns:
-            Formatted string with color codes
+            Uncolored change string
+        """
+        if change >= 0:
+            return f"↑ {change:>7.2f}%"
+        return f"↓ {-change:>7.2f}%"
+    
+    def _row_fields(self, coin_id: str, name: str,
+                    prices: Dict) -> Tuple[str, str, str, Optional[bool]]:
+        """
+        Format one coin's row independently of the renderer.
+        
+        Args:
+            coin_id: CoinGecko coin identifier
+            name: Display name for the coin
+            prices: Dictionary containing price data from API
+            
+        Returns:
+            Tuple of (name, price, change, is_up); is_up is None when the
+            API returned no price for the coin and the cells read "N/A"
+        """
+        data = prices.get(coin_id, {})
+        price = data.get("usd", 0)
+        if price <= 0:
+            return name, "N/A", "N/A", None
+        change = data.get("usd_24h_change", 0)
+        return name, f"${price:,.2f}", self._change_text(change), change >= 0
+    
+    def record_history(self, prices: Dict):
+        """
+        Append the latest prices to the history ring buffer.
+        
+        Args:
+            prices: Dictionary containing price data from API
+        """
+        if self._history is None:
+            return
+        col = self._hist_idx % self._history.shape[1]
+        self._history[:, col] = [
+            prices.get(coin_id, {}).get("usd", np.nan) for coin_id in self.config.coins
+        ]
+        self._hist_idx += 1
+    
+    def history_range(self) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        """
+        Get the minimum and maximum recorded price for each coin.
+        
+        Returns:
+            Tuple of (min, max) arrays aligned with config.coins, NaN for
+            coins with no recorded prices; None if numpy is not installed
+        """
+        if self._history is None:
+            return None
+        # Unfilled slots are NaN, so the whole buffer can be reduced at once
+        with warnings.catch_warnings():
+            # All-NaN rows are expected for coins the API never returned
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanmin(self._history, axis=1), np.nanmax(self._history, axis=1)
+    
+    def _range_texts(self) -> List[str]:
+        """
+        Format the recorded high/low spread of each coin as a percentage.
+        
+        Returns:
+            One string per coin in config.coins, "N/A" where unknown
+        """
+        bounds = self.history_range()
+        if bounds is None:
+            return ["N/A"] * len(self.config.coins)
+        low, high = bounds
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = (high - low) / low * 100
+        return [f"{s:.2f}%" if ok else "N/A" for s, ok in zip(spread.tolist(), np.isfinite(spread))]
+    
+    def _build_table(self, prices: Dict, updated_at: Optional[float] = None) -> "Table":
+        """
+        Build a rich Table for the current prices.
+        
+        Args:
+            prices: Dictionary containing price data from API
+            updated_at: Epoch time the prices were fetched (default: now)
+            
+        Returns:
+            Table ready to be handed to the Live renderer
         """
-        arrow = "↑" if change >= 0 else "↓"
-        color = Colors.GREEN if change >= 0 else Colors.RED
-        return f"{color}{arrow} {abs(change):>7.2f}%{Colors.RESET}"
+        table = Table(
+            caption=f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at))}"
+                    "\nPress Ctrl+C to exit",
+            min_width=60
+        )
+        table.add_column("Coin", style="bold", min_width=15)
+        table.add_column("Price (USD)", justify="right", min_width=15)
+        table.add_column("24h Change", justify="right", min_width=15)
+        table.add_column("Range", justify="right", min_width=10)
+        
+        rows = zip(self.config.coins, self.config.display_names, self._range_texts())
+        for coin_id, name, range_str in rows:
+            name, price_str, change_str, is_up = self._row_fields(coin_id, name, prices)
+            if is_up is not None:
+                change_str = f"[{'green' if is_up else 'red'}]{change_str}[/]"
+            table.add_row(name, price_str, change_str, range_str)
+        
+        return table
     
-    def display(self, prices: Dict):
+    def display(self, prices: Dict, updated_at: Optional[float] = None):
         """
         Display the dashboard with current prices.
         
+        With rich installed the Live renderer is updated with a fresh table.
+        Otherwise the cursor is moved home, only rows whose content changed
+        since the previous tick are rewritten, and the whole frame goes out
+        in a single write.
+        
         Args:
             prices: Dictionary containing price data from API
+            updated_at: Epoch time the prices were fetched (default: now)
         """
-        self.clear_screen()
+        if self._live is not None:
+            self._live.update(self._build_table(prices, updated_at))
+            return
+        
+        out: List[str] = []
+        write = out.append
+        green, red, reset = Colors.GREEN, Colors.RED, Colors.RESET
+        coins = self.config.coins
+        row_fmt = self._row_fmt
+        row_fields = self._row_fields
+        prev_rows = self._prev_rows
+        full_redraw = not prev_rows
+        
+        if full_redraw:
+            write("\033[2J\033[H")
+        else:
+            write("\033[H")
         
         # Header
-        print(f"{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{'Coin':<15} {'Price (USD)':>15} {'24h Change':>15}{Colors.RESET}")
-        print(f"{Colors.BOLD}{'=' * 60}{Colors.RESET}")
+        divider = self._divider
+        if full_redraw:
+            write(f"\033[K{divider}\n\033[K{self._header}\n\033[K{divider}\n")
+        else:
+            write("\033[B\033[B\033[B")
         
         # Coin data
-        for coin_id in self.config.coins:
-            data = prices.get(coin_id, {})
-            price = data.get("usd", 0)
-            change = data.get("usd_24h_change", 0)
+        for coin_id, name, range_str in zip(coins, self.config.display_names, self._range_texts()):
+            name, price_str, change_str, is_up = row_fields(coin_id, name, prices)
+            change_str = f"{change_str:>15}"
+            if is_up is not None:
+                change_str = f"{green if is_up else red}{change_str}{reset}"
             
-            price_str = f"${price:,.2f}" if price > 0 else "N/A"
-            change_str = self.format_price_change(change) if price > 0 else "N/A"
+            row = row_fmt(name=name, price=price_str, change=change_str, range=range_str)
+            if prev_rows.get(coin_id) != row:
+                write(f"\033[K{row}\n")
+                prev_rows[coin_id] = row
+            else:
+                write("\033[B")
+        
+        write(f"\033[K{divider}\n\033[K\n")
+        write(self._footer_fmt(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at))))
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+    
+    @staticmethod
+    def _next_deadline(next_tick: float, interval: float, now: float) -> Tuple[float, float]:
+        """
+        Advance the polling schedule by one interval.
+        
+        Args:
+            next_tick: Monotonic time of the tick that just ran
+            interval: Seconds until the following tick
+            now: Current monotonic time
             
-            print(f"{coin_id.capitalize():<15} {price_str:>15} {change_str:>15}")
+        Returns:
+            Tuple of (next_tick, delay) where delay is how long to sleep;
+            if the loop fell behind, the schedule restarts from now
+            instead of bursting to catch up
+        """
+        next_tick += interval
+        delay = next_tick - now
+        if delay < 0:
+            return now, 0.0
+        return next_tick, delay
+    
+    async def _fetch_loop(self, snapshots: "asyncio.Queue[Tuple[Dict, float]]"):
+        """
+        Periodically fetch prices and hand them to the renderer.
+        
+        Only the newest snapshot is kept: if the renderer has not consumed
+        the previous one yet, it is dropped in favour of the fresh data.
+        Responses served from the client's cache are not new data, so they
+        are neither recorded in the history nor redrawn.
+        
+        Args:
+            snapshots: Single-slot queue shared with _render_loop
+        """
+        # Schedule against a monotonic deadline so fetch and render time
+        # does not stretch the polling period.
+        next_tick = time.monotonic()
         
-        print(f"{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-        print(f"\nLast updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print("Press Ctrl+C to exit")
+        while True:
+            prices = await self.api.fetch_prices(self.config.coins)
+            interval = self.config.update_interval
+            
+            if isinstance(prices, RateLimited):
+                interval = max(interval, prices.retry_after)
+                print(f"Rate limited by API. Retrying in {interval:.0f}s...")
+                self._prev_rows.clear()
+            elif prices:
+                fetched_at = self.api.last_fetch_time
+                if fetched_at != self._last_fetch_time:
+                    self._last_fetch_time = fetched_at
+                    self.record_history(prices)
+                    if snapshots.full():
+                        snapshots.get_nowait()
+                    snapshots.put_nowait((prices, fetched_at))
+            else:
+                print(f"Failed to fetch prices. Retrying in {self.config.update_interval}s...")
+                self.logger.warning("Failed to fetch prices")
+                # The message scrolled the screen; redraw everything next tick
+                self._prev_rows.clear()
+            
+            next_tick, delay = self._next_deadline(next_tick, interval, time.monotonic())
+            await asyncio.sleep(delay)
     
-    def run(self):
+    async def _render_loop(self, snapshots: "asyncio.Queue[Tuple[Dict, float]]"):
+        """
+        Redraw the dashboard whenever a new price snapshot arrives.
+        
+        Args:
+            snapshots: Single-slot queue shared with _fetch_loop
+        """
+        while True:
+            prices, updated_at = await snapshots.get()
+            self.display(prices, updated_at)
+    
+    async def run(self):
         """
         Main loop for the dashboard.
         
-        Continuously fetches and displays price data until interrupted.
+        Runs the fetcher and renderer concurrently until cancelled.
         """
         self.logger.info("Starting Crypto Dashboard")
         self.logger.info(f"Tracking: {', '.join(self.config.coins)}")
         
+        snapshots: "asyncio.Queue[Tuple[Dict, float]]" = asyncio.Queue(maxsize=1)
+        
+        if self._live is not None:
+            self._live.start()
+        
         try:
-            while True:
-                prices = self.api.fetch_prices(self.config.coins)
-                
-                if prices:
-                    self.display(prices)
-                else:
-                    print(f"Failed to fetch prices. Retrying in {self.config.update_interval}s...")
-                    self.logger.warning("Failed to fetch prices")
-                
-                time.sleep(self.config.update_interval)
-                
-        except KeyboardInterrupt:
-            print("\n\nExiting Crypto Dashboard. Goodbye!")
-            self.logger.info("Dashboard stopped by user")
+            await asyncio.gather(self._fetch_loop(snapshots), self._render_loop(snapshots))
         finally:
-            self.api.close()
+            if self._live is not None:
+                self._live.stop()
+            await self.api.close()
 
 
 def setup_logging(verbose: bool = False):
     """
     Configure logging for the application.
     
+    Records go to crypto_dashboard.log only. The dashboard redraws the
+    terminal in place, so anything else written to stdout would be left
+    as stale fragments on screen.
+    
     Args:
         verbose: Enable debug logging if True
     """
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('crypto_dashboard.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    file_handler = logging.FileHandler('crypto_dashboard.log', delay=True)
+    file_handler.setFormatter(formatter)
+    
+    # Records are only enqueued on the calling thread; the listener thread
+    # does the actual file I/O off the fetch/render loop.
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -240,35 +650,60 @@ Examples:
         help='Update interval in seconds (default: 10)'
     )
     
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=30,
+        help='Seconds to reuse a fetched response instead of calling the API (default: 30)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
-        help='Enable verbose logging'
+        help='Enable verbose logging (written to crypto_dashboard.log)'
     )
     
     return parser.parse_args()
 
 
+async def run_dashboard(config: Config):
+    """
+    Create the API client and dashboard and run the update loop.
+    
+    The client is built here rather than in main() because aiohttp
+    sessions must be created inside a running event loop.
+    
+    Args:
+        config: Application configuration
+    """
+    api_client = CoinGeckoAPI(
+        config.api_base_url,
+        config.request_timeout,
+        config.cache_ttl,
+        backoff_cap=config.update_interval
+    )
+    dashboard = CryptoDashboard(config, api_client)
+    await dashboard.run()
+
+
 def main():
     """Main entry point for the application."""
     args = parse_arguments()
     setup_logging(args.verbose)
     
-    # Parse coin list
-    coin_list = [coin.strip() for coin in args.coins.split(',')]
-    
-    # Create configuration
+    # Create configuration (coin IDs are normalized by Config)
     config = Config(
-        coins=coin_list,
-        update_interval=args.interval
+        coins=args.coins.split(','),
+        update_interval=args.interval,
+        cache_ttl=args.cache_ttl
     )
     
-    # Initialize API client and dashboard
-    api_client = CoinGeckoAPI(config.api_base_url, config.request_timeout)
-    dashboard = CryptoDashboard(config, api_client)
-    
     # Run the dashboard
-    dashboard.run()
+    try:
+        asyncio.run(run_dashboard(config))
+    except KeyboardInterrupt:
+        print("\n\nExiting Crypto Dashboard. Goodbye!")
+        logging.getLogger(__name__).info("Dashboard stopped by user")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,410 @@
+"""Tests for the CoinGecko client and dashboard helpers."""
+
+import asyncio
+import inspect
+import re
+import time
+from contextlib import suppress
+from email.utils import formatdate
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import crypto_dashboard as cd
+
+
+PRICES = {"bitcoin": {"usd": 100.0, "usd_24h_change": 1.5}}
+
+
+def run_against(responses, check, **api_kwargs):
+    """
+    Serve /simple/price from a list of handlers and run check(api, requests).
+
+    Each request is answered by the next handler in responses; the last one
+    repeats once the list is exhausted.
+    """
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        return responses[min(len(requests), len(responses)) - 1](request)
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/simple/price", handler)
+        async with TestServer(app) as server:
+            kwargs = {"cache_ttl": 0, "backoff_base": 0.01, "backoff_cap": 0.05}
+            kwargs.update(api_kwargs)
+            api = cd.CoinGeckoAPI(str(server.make_url("")).rstrip("/"), timeout=5, **kwargs)
+            try:
+                return await check(api, requests)
+            finally:
+                await api.close()
+
+    return asyncio.run(scenario())
+
+
+class FakeAPI:
+    """Stands in for CoinGeckoAPI, replaying scripted (prices, fetched_at) results."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.last_fetch_time = None
+        self.exhausted = asyncio.Event()
+
+    async def fetch_prices(self, coin_ids):
+        if not self.results:
+            self.exhausted.set()
+            await asyncio.Event().wait()
+        prices, self.last_fetch_time = self.results.pop(0)
+        return prices
+
+
+def run_fetch_loop(results, **config):
+    """
+    Run _fetch_loop until the scripted results run out.
+
+    Returns the dashboard and whatever was left in the snapshot queue.
+    """
+    async def scenario():
+        api = FakeAPI(results)
+        config.setdefault("update_interval", 0)
+        dashboard = cd.CryptoDashboard(cd.Config(coins=["bitcoin"], **config), api)
+        snapshots = asyncio.Queue(maxsize=1)
+        task = asyncio.ensure_future(dashboard._fetch_loop(snapshots))
+        await asyncio.wait_for(api.exhausted.wait(), 5)
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        queued = []
+        while not snapshots.empty():
+            queued.append(snapshots.get_nowait())
+        return dashboard, queued
+
+    return asyncio.run(scenario())
+
+
+def ok(request):
+    return web.json_response(PRICES)
+
+
+def status(code, **headers):
+    return lambda request: web.Response(status=code, headers=headers)
+
+
+# Retry-After parsing
+
+@pytest.mark.parametrize("value, expected", [
+    ("5", 5.0),
+    ("0.5", 0.5),
+    ("-3", 0.0),
+    (None, None),
+    ("", None),
+    ("soon", None),
+    ("inf", None),
+    ("-inf", None),
+    ("nan", None),
+    ("1e9", cd.CoinGeckoAPI.MAX_RETRY_AFTER),
+])
+def test_parse_retry_after(value, expected):
+    assert cd.CoinGeckoAPI._parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(time.time() + 60, usegmt=True)
+    assert 55 <= cd.CoinGeckoAPI._parse_retry_after(value) <= 60
+
+
+def test_parse_retry_after_past_http_date():
+    value = formatdate(time.time() - 60, usegmt=True)
+    assert cd.CoinGeckoAPI._parse_retry_after(value) == 0.0
+
+
+# Backoff and retries
+
+def test_next_delay_stays_within_bounds():
+    async def check(api, requests):
+        delay = api.backoff_base
+        for _ in range(200):
+            delay = api._next_delay(delay)
+            assert api.backoff_base <= delay <= api.backoff_cap
+
+    run_against([ok], check, backoff_base=0.5, backoff_cap=10)
+
+
+def test_next_delay_honours_retry_after_up_to_cap():
+    async def check(api, requests):
+        assert api._next_delay(0.5, retry_after=8) == 8
+        assert api._next_delay(0.5, retry_after=30) == 10
+
+    run_against([ok], check, backoff_base=0.5, backoff_cap=10)
+
+
+def test_retries_5xx_then_succeeds():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) == PRICES
+        assert len(requests) == 3
+
+    run_against([status(503), status(502), ok], check)
+
+
+def test_gives_up_after_max_retries():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) is None
+        assert len(requests) == api.max_retries + 1
+
+    run_against([status(500)], check)
+
+
+def test_long_retry_after_returns_rate_limited():
+    async def check(api, requests):
+        result = await api.fetch_prices(["bitcoin"])
+        assert result == cd.RateLimited(120.0)
+        assert len(requests) == 1
+
+    run_against([status(429, **{"Retry-After": "120"})], check)
+
+
+def test_short_retry_after_is_retried():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) == PRICES
+        assert len(requests) == 2
+
+    run_against([status(429, **{"Retry-After": "0"}), ok], check)
+
+
+def test_unbounded_retry_after_is_clamped():
+    async def check(api, requests):
+        result = await api.fetch_prices(["bitcoin"])
+        assert result == cd.RateLimited(api.MAX_RETRY_AFTER)
+
+    run_against([status(429, **{"Retry-After": "99999999"})], check)
+
+
+def test_non_finite_retry_after_is_ignored():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) == PRICES
+        assert len(requests) == 2
+
+    run_against([status(429, **{"Retry-After": "inf"}), ok], check)
+
+
+def test_final_429_returns_rate_limited():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) == cd.RateLimited(0.0)
+        assert len(requests) == api.max_retries + 1
+
+    run_against([status(429, **{"Retry-After": "0"})], check)
+
+
+def test_final_429_without_retry_after_fails():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) is None
+
+    run_against([status(429)], check)
+
+
+def test_client_errors_are_not_retried():
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) is None
+        assert len(requests) == 1
+
+    run_against([status(404)], check)
+
+
+# TTL cache
+
+def test_cache_serves_repeat_calls_within_ttl():
+    async def check(api, requests):
+        first = await api.fetch_prices(["bitcoin"])
+        fetched_at = api.last_fetch_time
+        assert await api.fetch_prices(["bitcoin"]) == first
+        assert len(requests) == 1
+        assert api.last_fetch_time == fetched_at
+
+    run_against([ok], check, cache_ttl=60)
+
+
+def test_cache_refetches_one_ttl_later():
+    async def check(api, requests):
+        await api.fetch_prices(["bitcoin"])
+        await asyncio.sleep(0.2)
+        await api.fetch_prices(["bitcoin"])
+        assert len(requests) == 1
+        await asyncio.sleep(0.3)
+        await api.fetch_prices(["bitcoin"])
+        assert len(requests) == 2
+
+    run_against([ok], check, cache_ttl=0.5)
+
+
+def test_config_honours_cache_ttl():
+    assert cd.Config(coins=["bitcoin"], update_interval=1, cache_ttl=30).cache_ttl == 30
+    default = inspect.signature(cd.CoinGeckoAPI).parameters["cache_ttl"].default
+    assert cd.Config(coins=["bitcoin"]).cache_ttl == default
+
+
+def test_fetch_loop_skips_cached_results():
+    other = {"bitcoin": {"usd": 200.0, "usd_24h_change": 1.5}}
+    dashboard, queued = run_fetch_loop([(PRICES, 1.0), (PRICES, 1.0), (other, 2.0)])
+
+    assert dashboard._hist_idx == 2
+    assert queued == [(other, 2.0)]
+
+
+# Conditional requests
+
+def test_not_modified_returns_previous_body():
+    def etagged(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response(PRICES, headers={"ETag": '"v1"'})
+
+    async def check(api, requests):
+        assert await api.fetch_prices(["bitcoin"]) == PRICES
+        assert await api.fetch_prices(["bitcoin"]) == PRICES
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    run_against([etagged], check)
+
+
+def test_no_conditional_header_without_etag():
+    async def check(api, requests):
+        await api.fetch_prices(["bitcoin"])
+        await api.fetch_prices(["bitcoin"])
+        assert all("If-None-Match" not in r.headers for r in requests)
+
+    run_against([ok], check)
+
+
+# Rendering helpers
+
+def test_row_fields():
+    dashboard = cd.CryptoDashboard(cd.Config(coins=["bitcoin", "ethereum"]), None)
+    prices = {"bitcoin": {"usd": 1234.5, "usd_24h_change": -2.25}}
+
+    assert dashboard._row_fields("bitcoin", "Bitcoin", prices) == (
+        "Bitcoin", "$1,234.50", "↓    2.25%", False
+    )
+    assert dashboard._row_fields("ethereum", "Ethereum", prices) == (
+        "Ethereum", "N/A", "N/A", None
+    )
+
+
+# Price history
+
+def test_record_history_wraps_around():
+    dashboard = cd.CryptoDashboard(cd.Config(coins=["bitcoin"], history_size=3), None)
+    for price in (1.0, 2.0, 3.0, 4.0):
+        dashboard.record_history({"bitcoin": {"usd": price}})
+
+    assert dashboard._history[0].tolist() == [4.0, 2.0, 3.0]
+    low, high = dashboard.history_range()
+    assert (low[0], high[0]) == (2.0, 4.0)
+
+
+def test_range_texts_handle_missing_prices():
+    dashboard = cd.CryptoDashboard(cd.Config(coins=["bitcoin", "ethereum"], history_size=4), None)
+    assert dashboard._range_texts() == ["N/A", "N/A"]
+
+    dashboard.record_history({"bitcoin": {"usd": 100.0}})
+    dashboard.record_history({"bitcoin": {"usd": 125.0}})
+    assert dashboard._range_texts() == ["25.00%", "N/A"]
+
+
+def test_colored_rows_stay_aligned(monkeypatch, capsys):
+    monkeypatch.setattr(cd, "HAS_RICH", False)
+    dashboard = cd.CryptoDashboard(cd.Config(coins=["bitcoin", "ethereum"]), None)
+    dashboard.display(PRICES)
+
+    rows = [line for line in capsys.readouterr().out.split("\n") if "N/A" in line or "$" in line]
+    plain = [re.sub(r"\033\[[0-9;]*[A-Za-z]", "", row) for row in rows]
+    assert len({len(row) for row in plain}) == 1
+
+
+# Fetcher/renderer split
+
+def test_fetch_loop_keeps_only_newest_snapshot():
+    snapshots = [({"bitcoin": {"usd": float(i)}}, float(i)) for i in range(1, 4)]
+    dashboard, queued = run_fetch_loop(snapshots)
+
+    assert queued == [snapshots[-1]]
+    assert dashboard._hist_idx == 3
+
+
+def test_render_loop_draws_each_snapshot(monkeypatch):
+    drawn = []
+    dashboard = cd.CryptoDashboard(cd.Config(coins=["bitcoin"]), None)
+    monkeypatch.setattr(dashboard, "display", lambda prices, updated_at: drawn.append(updated_at))
+
+    async def scenario():
+        snapshots = asyncio.Queue(maxsize=1)
+        task = asyncio.ensure_future(dashboard._render_loop(snapshots))
+        for i in range(3):
+            await snapshots.put((PRICES, float(i)))
+            await asyncio.sleep(0)
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert drawn == [0.0, 1.0, 2.0]
+
+
+# In-place ANSI redraw
+
+def ansi_dashboard(monkeypatch, coins=("bitcoin",)):
+    monkeypatch.setattr(cd, "HAS_RICH", False)
+    return cd.CryptoDashboard(cd.Config(coins=list(coins)), None)
+
+
+def test_first_frame_is_a_full_redraw(monkeypatch, capsys):
+    dashboard = ansi_dashboard(monkeypatch)
+    dashboard.display(PRICES)
+    out = capsys.readouterr().out
+
+    assert out.startswith("\033[2J\033[H")
+    assert "Coin" in out and "Bitcoin" in out
+
+
+def test_unchanged_rows_are_skipped(monkeypatch, capsys):
+    dashboard = ansi_dashboard(monkeypatch, coins=("bitcoin", "ethereum"))
+    dashboard.display(PRICES)
+    capsys.readouterr()
+
+    changed = dict(PRICES, ethereum={"usd": 10.0, "usd_24h_change": -1.0})
+    dashboard.display(changed)
+    out = capsys.readouterr().out
+
+    assert out.startswith("\033[H\033[B\033[B\033[B")
+    assert "\033[2J" not in out
+    assert "Coin" not in out
+    assert "Bitcoin" not in out
+    assert "Ethereum" in out
+
+
+def test_cleared_rows_force_full_redraw(monkeypatch, capsys):
+    dashboard = ansi_dashboard(monkeypatch)
+    dashboard.display(PRICES)
+    dashboard._prev_rows.clear()
+    capsys.readouterr()
+
+    dashboard.display(PRICES)
+    out = capsys.readouterr().out
+    assert out.startswith("\033[2J\033[H")
+    assert "Bitcoin" in out
+
+
+# Monotonic scheduling
+
+def test_next_deadline_keeps_fixed_period():
+    # Work took 3s of a 10s interval; sleep only the remainder
+    assert cd.CryptoDashboard._next_deadline(100.0, 10, 103.0) == (110.0, 7.0)
+
+
+def test_next_deadline_resets_when_behind():
+    # Work overran the interval; restart from now rather than bursting
+    assert cd.CryptoDashboard._next_deadline(100.0, 10, 115.0) == (115.0, 0.0)
+    assert cd.CryptoDashboard._next_deadline(115.0, 10, 116.0) == (125.0, 9.0)